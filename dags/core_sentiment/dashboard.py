@@ -14,6 +14,15 @@ import streamlit as st
 
 logger = logging.getLogger(__name__)
 
+# Brand colors shared by every per-company chart
+COMPANY_COLORS = {
+    "Amazon": "#FF9900",
+    "Apple": "#A2AAAD",
+    "Google": "#4285F4",
+    "Microsoft": "#00A4EF",
+    "Meta": "#0668E1",
+}
+
 # Page config
 st.set_page_config(
     page_title="Core Sentiment Dashboard",
@@ -43,8 +52,8 @@ def get_connection():
     db_name = os.getenv("DB_NAME", "core_sentiment")
     db_user = os.getenv("DB_USER", "postgres")
     db_password = os.getenv("DB_PASSWORD", "postgres")
-    db_host = "core_sentiment_db"
-    db_port = 5432
+    db_host = os.getenv("DB_HOST", "core_sentiment_db")
+    db_port = int(os.getenv("DB_PORT", "5432"))
 
     try:
         conn = psycopg.connect(
@@ -87,14 +96,13 @@ def load_filtered_pageviews(days=7, companies=None):
             filtered_at,
             filter_method
         FROM filtered_pageviews
-        WHERE processing_date >= CURRENT_DATE - INTERVAL '{days} days'
+        WHERE processing_date >= CURRENT_DATE - make_interval(days => %s)
         {company_filter}
         ORDER BY processing_date DESC, count_views DESC
     """
 
-    if companies:
-        return pd.read_sql(query, conn, params=companies)  # type: ignore
-    return pd.read_sql(query, conn)  # type: ignore
+    params = [days] + list(companies or [])
+    return pd.read_sql(query, conn, params=params)  # type: ignore
 
 
 @st.cache_data(ttl=300)
@@ -102,7 +110,7 @@ def get_company_rankings(days=7, companies=None):
     """Get company rankings."""
     conn = get_connection()
 
-    query = f"""
+    query = """
         WITH daily_metrics AS (
             SELECT 
                 company,
@@ -113,7 +121,7 @@ def get_company_rankings(days=7, companies=None):
                 MIN(count_views) as min_views,
                 PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY count_views) as median_views
             FROM filtered_pageviews
-            WHERE processing_date >= CURRENT_DATE - INTERVAL '{days} days'
+            WHERE processing_date >= CURRENT_DATE - make_interval(days => %s)
             GROUP BY company
         ),
         rankings AS (
@@ -137,7 +145,7 @@ def get_company_rankings(days=7, companies=None):
         ORDER BY rank
     """
 
-    df = pd.read_sql(query, conn)  # type: ignore
+    df = pd.read_sql(query, conn, params=[days])  # type: ignore
 
     # Filter by companies if specified
     if companies:
@@ -163,15 +171,14 @@ def get_daily_trends(days=7, companies=None):
             COUNT(*) as page_count,
             SUM(count_views) as total_views
         FROM filtered_pageviews
-        WHERE processing_date >= CURRENT_DATE - INTERVAL '{days} days'
+        WHERE processing_date >= CURRENT_DATE - make_interval(days => %s)
         {company_filter}
         GROUP BY processing_date, company
         ORDER BY processing_date, company
     """
 
-    if companies:
-        return pd.read_sql(query, conn, params=companies)  # type: ignore
-    return pd.read_sql(query, conn)  # type: ignore
+    params = [days] + list(companies or [])
+    return pd.read_sql(query, conn, params=params)  # type: ignore
 
 
 @st.cache_data(ttl=300)
@@ -195,14 +202,14 @@ def get_winner_analysis(days=7):
     """Get winner vs runner-up analysis."""
     conn = get_connection()
 
-    query = f"""
+    query = """
         WITH company_totals AS (
             SELECT 
                 company,
                 COUNT(*) as page_count,
                 SUM(count_views) as total_views
             FROM filtered_pageviews
-            WHERE processing_date >= CURRENT_DATE - INTERVAL '{days} days'
+            WHERE processing_date >= CURRENT_DATE - make_interval(days => %s)
             GROUP BY company
         ),
         winner AS (
@@ -235,7 +242,7 @@ def get_winner_analysis(days=7):
         WHERE w.rank = 1
     """
     try:
-        df = pd.read_sql(query, conn)  # type: ignore
+        df = pd.read_sql(query, conn, params=[days])  # type: ignore
         if not df.empty:
             return df.iloc[0]
         return None
@@ -369,13 +376,7 @@ if not rankings_df.empty:
             names="company",
             title="Market Share by Views",
             color="company",
-            color_discrete_map={
-                "Amazon": "#FF9900",
-                "Apple": "#A2AAAD",
-                "Google": "#4285F4",
-                "Microsoft": "#00A4EF",
-                "Meta": "#0668E1",
-            },
+            color_discrete_map=COMPANY_COLORS,
         )
         fig_pie.update_traces(textposition="inside", textinfo="percent+label")
         st.plotly_chart(fig_pie, use_container_width=True)
@@ -396,13 +397,7 @@ if not trends_df.empty:
         color="company",
         title=f"Daily Total Views by Company (Last {days} Days)",
         markers=True,
-        color_discrete_map={
-            "Amazon": "#FF9900",
-            "Apple": "#A2AAAD",
-            "Google": "#4285F4",
-            "Microsoft": "#00A4EF",
-            "Meta": "#0668E1",
-        },
+        color_discrete_map=COMPANY_COLORS,
     )
     fig_trend.update_layout(
         xaxis_title="Date", yaxis_title="Total Views", hovermode="x unified", height=400
@@ -1,19 +1,38 @@
 # download_data.py
 
 import gzip
+import io
 import logging
 import os
 import random
 import shutil
 from pathlib import Path
 
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
 from core_sentiment.include.app_config.settings import config
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+# One session for the link scrape and the download that follows: both hit
+# the same Wikimedia host, so TCP+TLS is negotiated once per worker
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=2,
+        pool_maxsize=4,
+        max_retries=Retry(total=2, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504]),
+    ),
+)
+
+# 1 MiB transfer chunks — the old 8 KiB default meant ~100k write syscalls
+# and progress callbacks on a 1 GB dump
+_DOWNLOAD_CHUNK_SIZE = 1 << 20
+
 
 class DownloadError(Exception):
     """Custom exception for download errors"""
@@ -34,13 +53,13 @@ def get_random_wiki_gz_link(url: str) -> str:
     """
 
     logger.info(f"Fetching gzip file links from: {url}")
-    html = requests.get(url).text
-    soup = BeautifulSoup(html, "lxml")
+    response = _SESSION.get(url, timeout=30)
 
+    # Parse the directory listing in libxml2 and select hrefs via XPath —
+    # no Python-level tree of thousands of <a> tags
+    tree = lxml.html.fromstring(response.content)
     links = [
-        href
-        for a in soup.find_all("a", href=True)
-        if (href := a.get("href")) and isinstance(href, str) and href.endswith(".gz")
+        href for href in tree.xpath("//a/@href") if href.endswith(".gz")
     ]
 
     if not links:
@@ -52,7 +71,9 @@ def get_random_wiki_gz_link(url: str) -> str:
     return full_url
 
 
-def download_file(url: str, destination: Path, chunk_size: int = 8192) -> Path:
+def download_file(
+    url: str, destination: Path, chunk_size: int = _DOWNLOAD_CHUNK_SIZE
+) -> Path:
     """
     Function:
         - Downloads a file from the specified URL and save it into RAW_PAGE_VIEWS_DIR.
@@ -70,11 +91,16 @@ def download_file(url: str, destination: Path, chunk_size: int = 8192) -> Path:
         DownloadError: If download fails or file is corrupted
     """
 
+    # Write to a .tmp sibling and publish with os.replace on success, so
+    # a killed task never leaves a truncated file at the final path for
+    # the reuse gate to pick up
+    tmp_path = destination.with_name(destination.name + ".tmp")
+
     try:
         logger.info(f"Downloading from: {url}")
 
         # Start the request
-        with requests.get(url, stream=True, timeout=30) as response:
+        with _SESSION.get(url, stream=True, timeout=30) as response:
             response.raise_for_status()
             total_size = int(response.headers.get("content-length", 0))
 
@@ -84,7 +110,7 @@ def download_file(url: str, destination: Path, chunk_size: int = 8192) -> Path:
             if use_progress_bar:
                 logger.info("Using tqdm progress bar (interactive mode activated)")
                 with (
-                    open(destination, "wb") as f,
+                    open(tmp_path, "wb") as f,
                     tqdm(
                         total=total_size,
                         unit="B",
@@ -94,25 +120,33 @@ def download_file(url: str, destination: Path, chunk_size: int = 8192) -> Path:
                         ascii=True,
                     ) as bar,
                 ):
+                    # Batch progress updates to every ~4 MiB so the bar
+                    # refresh does not run once per transfer chunk
+                    pending = 0
                     for chunk in response.iter_content(chunk_size=chunk_size):
                         if chunk:
-                            size = f.write(chunk)
-                            bar.update(size)
+                            pending += f.write(chunk)
+                            if pending >= (4 << 20):
+                                bar.update(pending)
+                                pending = 0
+                    if pending:
+                        bar.update(pending)
 
             else:
-                with open(destination, "wb") as f:
+                with open(tmp_path, "wb") as f:
                     shutil.copyfileobj(response.raw, f)
 
+        os.replace(tmp_path, destination)
         logger.info(f"File downloaded successfully: {destination}")
         return destination
 
     except requests.RequestException as e:
-        if destination.exists():
-            destination.unlink(missing_ok=True)  # Cleanup partial download
+        tmp_path.unlink(missing_ok=True)  # Cleanup partial download
         logger.error(f"Network-related error: {e}")
         raise DownloadError(f"Failed to download {url}: {e}")
 
     except Exception as e:
+        tmp_path.unlink(missing_ok=True)
         logger.error(f"Unexpected error: {e}")
         raise DownloadError(str(e))
 
@@ -131,13 +165,20 @@ def validate_gz_file(file_path: Path) -> bool:
     """
 
     try:
-        with gzip.open(file_path, "rb") as f:
+        # Buffer between zlib and the consumer so the probe read does not
+        # pay a Python-to-C transition per tiny read
+        with io.BufferedReader(gzip.open(file_path, "rb"), buffer_size=1 << 20) as f:
             f.read(1)  # Try reading the first byte
-        logger.info(f"File validation passed: {file_path}")
-        return True
-    except Exception as e:
+    except gzip.BadGzipFile as e:
         logger.error(f"Invalid gzip file {file_path}: {e}")
         return False
+    # EOFError is what a truncated gzip raises; it is not an OSError
+    except (EOFError, OSError) as e:
+        logger.error(f"Cannot read gzip file {file_path}: {e}")
+        return False
+
+    logger.info(f"File validation passed: {file_path}")
+    return True
 
 
 def download_random_wiki_file() -> str:
@@ -171,6 +212,13 @@ def download_random_wiki_file() -> str:
         raw_dir.mkdir(parents=True, exist_ok=True)
         file_path = raw_dir / Path(file_url).name
 
+        # Dump files are immutable once published, and download_file only
+        # moves a file to this path once the transfer completed, so a file
+        # that is already here and passes the gzip check needs no re-download
+        if file_path.exists() and validate_gz_file(file_path):
+            logger.info(f"Reusing cached dump file: {file_path}")
+            return str(file_path)
+
         # Download the file
         downloaded_path = download_file(file_url, file_path)
 
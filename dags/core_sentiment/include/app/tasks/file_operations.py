@@ -1,8 +1,10 @@
-import json
+import csv
 import logging
+import os
 from pathlib import Path
 from typing import Any, Dict
 
+import orjson
 from core_sentiment.include.app_config.settings import config
 from pendulum import now
 
@@ -15,7 +17,7 @@ def save_filtered_output(filtered_result: Dict[str, Any]) -> Dict[str, Any]:
         - Save JSON and CSV outputs to local disk.
 
     Args:
-        - filtered_result: Dictionary with json_output and csv_output
+        - filtered_result: Dictionary with filtered_file path
 
     Returns:
         - Metadata about saved files
@@ -36,28 +38,39 @@ def save_filtered_output(filtered_result: Dict[str, Any]) -> Dict[str, Any]:
         if not isinstance(filtered_result, dict):
             raise ValueError(f"Expected dict, got {type(filtered_result)}")
 
-        json_output = filtered_result.get("json_output", [])
-        csv_output = filtered_result.get("csv_output", "")
+        filtered_file = filtered_result.get("filtered_file", "")
+        json_output = (
+            orjson.loads(Path(filtered_file).read_bytes()) if filtered_file else []
+        )
 
-        # Write to JSON
-        logger.info(f"Writing JSON output to: {json_path}")
-        with open(json_path, "w", encoding="utf-8") as json_file:
-            json.dump(json_output, json_file, indent=2, ensure_ascii=False)
-
-        # Verify JSON file was created
-        if not json_path.exists():
-            raise IOError(f"Failed to create JSON file: {json_path}")
-        logger.info(f"JSON file created: {json_path.stat().st_size} bytes")
+        # Write to a .tmp sibling and publish with os.replace: a crashed
+        # task leaves no half-written file behind for a retry to misread.
+        # The write() return value doubles as the size report, so the
+        # freshly written files are never re-stat'ed.
 
-        # Write to CSV
+        # JSON — orjson encodes straight to UTF-8 bytes, so the pretty-
+        # printed dump skips building an intermediate Python string
+        logger.info(f"Writing JSON output to: {json_path}")
+        json_tmp = json_path.with_suffix(".json.tmp")
+        with open(json_tmp, "wb") as json_file:
+            json_bytes = json_file.write(
+                orjson.dumps(json_output, option=orjson.OPT_INDENT_2)
+            )
+        os.replace(json_tmp, json_path)
+        logger.info(f"JSON file created: {json_bytes} bytes")
+
+        # CSV, rebuilt from the records — XCom no longer carries a second,
+        # CSV-encoded copy of the same data
         logger.info(f"Writing CSV output to: {csv_path}")
-        with open(csv_path, "w", encoding="utf-8") as csv_file:
-            csv_file.write(csv_output)
-
-        # Verify CSV file was created
-        if not csv_path.exists():
-            raise IOError(f"Failed to create CSV file: {csv_path}")
-        logger.info(f"CSV file created: {csv_path.stat().st_size} bytes")
+        csv_tmp = csv_path.with_suffix(".csv.tmp")
+        with open(csv_tmp, "w", encoding="utf-8", newline="") as csv_file:
+            if json_output:
+                writer = csv.DictWriter(csv_file, fieldnames=list(json_output[0]))
+                writer.writeheader()
+                writer.writerows(json_output)
+            csv_bytes = csv_file.tell()
+        os.replace(csv_tmp, csv_path)
+        logger.info(f"CSV file created: {csv_bytes} bytes")
 
         result = {
             "json_file": str(json_path),
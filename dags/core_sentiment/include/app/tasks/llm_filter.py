@@ -1,45 +1,47 @@
 import json
 import logging
+from pathlib import Path
 from typing import Any, Dict, Hashable, List, Sequence
 
+import orjson
 import pandas as pd
 import requests
 from core_sentiment.include.app_config.settings import config
+from pendulum import now
 
 logger = logging.getLogger(__name__)
 
 
 def process_with_llm(
-    prefiltered_csv_file: str, system_prompt: str, batch_size: int = 50
+    prefiltered_file: str, system_prompt: str, batch_size: int = 50
 ) -> Dict[str, Any]:
     """
     Function:
         - Main entry point: Process pre-filtered data through LLM in batches.
-        - Load pre-filtered CSV
+        - Load pre-filtered Parquet file
         - Split into batches for efficient processing
         - Send each batch to Ollama API
         - Aggregate filtered results
         - Return in format compatible with downstream tasks
 
     Args:
-        prefiltered_csv_file: Path to pre-filtered CSV file
+        prefiltered_file: Path to pre-filtered Parquet file
         system_prompt: System prompt with filtering rules
         batch_size: Number of records per batch (default: 50)
 
     Returns:
         Dictionary with:
-            - json_output: List of filtered records
-            - csv_output: CSV string of filtered data
+            - filtered_file: Path to the JSON file of filtered records
             - total_records: Count of filtered records
             - statistics: Processing stats
     """
     logger.info("=" * 60)
     logger.info("LLM FILTERING WITH DIRECT OLLAMA API")
     logger.info("=" * 60)
-    logger.info(f"Loading pre-filtered data: {prefiltered_csv_file}")
+    logger.info(f"Loading pre-filtered data: {prefiltered_file}")
 
-    # Load data
-    df = pd.read_csv(prefiltered_csv_file)
+    # Load data (typed columns come straight from Parquet)
+    df = pd.read_parquet(prefiltered_file)
     total_rows = len(df)
 
     logger.info(f"Total rows to process: {total_rows:,}")
@@ -191,8 +193,7 @@ def generate_final_results(
         logger.error("❌ No records passed LLM filtering!")
         logger.error("All records were filtered out or all batches failed")
         return {
-            "json_output": [],
-            "csv_output": "",
+            "filtered_file": "",
             "total_records": 0,
             "statistics": {
                 "input_records": total_input,
@@ -203,11 +204,8 @@ def generate_final_results(
             },
         }
 
-    # Create DataFrame from results
-    final_df = pd.DataFrame(filtered_results)
-
     # Calculate statistics
-    output_count = len(final_df)
+    output_count = len(filtered_results)
     filter_rate = (
         ((total_input - output_count) / total_input * 100) if total_input > 0 else 0
     )
@@ -226,14 +224,26 @@ def generate_final_results(
     logger.info(f"Failed batches:     {failed_batches}")
     logger.info("=" * 60)
 
-    # Log sample of filtered pages
-    logger.info("Sample of filtered pages:")
-    for idx, row in enumerate(final_df.head(10).itertuples(), start=1):
-        logger.info(f"  {idx}. {row.page_title}: {row.count_views:,} views")
+    # Log sample of filtered pages (straight from the records list — no need
+    # for a head() DataFrame and namedtuple allocation when logging is off)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Sample of filtered pages:")
+        for idx, record in enumerate(filtered_results[:10], start=1):
+            logger.info(
+                f"  {idx}. {record['page_title']}: {record['count_views']:,} views"
+            )
+
+    # Persist the records and hand downstream a path: XCom stays O(1)
+    # instead of round-tripping the whole dataset through the metadata DB
+    output_dir = Path(config.PROCESSED_PAGEVIEWS_DIR)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    timestamp = now().format("YYYYMMDD_HHmmss")
+    filtered_file = output_dir / f"llm_filtered_{timestamp}.json"
+    filtered_file.write_bytes(orjson.dumps(filtered_results))
+    logger.info(f"✓ Filtered records written to: {filtered_file}")
 
     return {
-        "json_output": filtered_results,
-        "csv_output": final_df.to_csv(index=False),
+        "filtered_file": str(filtered_file),
         "total_records": output_count,
         "statistics": {
             "input_records": total_input,
@@ -281,8 +291,7 @@ def create_llm_prompt(batch_records: Sequence[Dict[Hashable, Any]]) -> str:
         "json_output": [
             {{"domain": "en.wikipedia.org", "page_title": "iPhone", "count_views": 50000}},
             {{"domain": "en.wikipedia.org", "page_title": "AWS", "count_views": 35000}}
-        ],
-        "csv_output": "domain,page_title,count_views\\nen.wikipedia.org,iPhone,50000\\n..."
+        ]
     }}
 
     IMPORTANT: Return ONLY valid JSON. No markdown, no explanations, just the JSON object.
@@ -304,7 +313,7 @@ def call_ollama_api(
         - system_prompt: System prompt with filtering rules
 
     Returns:
-        - Dictionary with json_output and csv_output
+        - Dictionary with json_output
 
     Raises:
         - Exception: If API call fails critically
@@ -328,10 +337,12 @@ def call_ollama_api(
         },
     }
 
-    logger.info(
-        f"Calling Ollama at {config.OLLAMA_HOST} with model {config.OLLAMA_MODEL}"
+    # Per-batch chatter goes to debug — process_with_llm already logs one
+    # line per batch, and host/model are logged once at startup
+    logger.debug(
+        f"Calling Ollama at {config.OLLAMA_HOST} with model {config.OLLAMA_MODEL} "
+        f"for {len(batch_records)} records"
     )
-    logger.info(f"Processing batch of {len(batch_records)} records...")
 
     try:
         response = requests.post(url, json=payload, timeout=config.OLLAMA_TIMEOUT)
@@ -340,7 +351,7 @@ def call_ollama_api(
         if response.status_code != 200:
             logger.error(f"Ollama API error: {response.status_code}")
             logger.error(f"Response: {response.text}")
-            return {"json_output": [], "csv_output": ""}
+            return {"json_output": []}
 
         # Parse response
         result = response.json()
@@ -348,10 +359,10 @@ def call_ollama_api(
 
         if not llm_response:
             logger.error("Empty response from Ollama")
-            return {"json_output": [], "csv_output": ""}
+            return {"json_output": []}
 
         # Log response info
-        logger.info(f"LLM response length: {len(llm_response)} characters")
+        logger.debug(f"LLM response length: {len(llm_response)} characters")
         logger.debug(f"LLM response preview: {llm_response[:300]}")
 
         # Parse JSON response
@@ -361,16 +372,7 @@ def call_ollama_api(
         if "json_output" not in parsed:
             logger.error("Response missing 'json_output' key")
             logger.error(f"Response keys: {list(parsed.keys())}")
-            return {"json_output": [], "csv_output": ""}
-
-        # Generate CSV if missing
-        if "csv_output" not in parsed or not parsed["csv_output"]:
-            logger.warning("Response missing 'csv_output' key, will generate it")
-            if parsed["json_output"]:
-                df = pd.DataFrame(parsed["json_output"])
-                parsed["csv_output"] = df.to_csv(index=False)
-            else:
-                parsed["csv_output"] = ""
+            return {"json_output": []}
 
         # Log filtering results
         filtered_count = len(parsed["json_output"])
@@ -390,22 +392,22 @@ def call_ollama_api(
     except requests.exceptions.Timeout:
         logger.error(f"Ollama request timed out after {config.OLLAMA_TIMEOUT}s")
         logger.error("Consider increasing OLLAMA_TIMEOUT or reducing batch size")
-        return {"json_output": [], "csv_output": ""}
+        return {"json_output": []}
 
     except requests.exceptions.ConnectionError as e:
         logger.error(f"Cannot connect to Ollama at {config.OLLAMA_HOST}")
         logger.error("Verify Ollama is running and accessible from Airflow")
         logger.error(f"Error details: {e}")
-        return {"json_output": [], "csv_output": ""}
+        return {"json_output": []}
 
     except json.JSONDecodeError as e:
         logger.error(f"Failed to parse LLM response as JSON: {e}")
         logger.error(f"Raw response preview: {llm_response[:500]}")
-        return {"json_output": [], "csv_output": ""}
+        return {"json_output": []}
 
     except Exception as e:
         logger.error(f"Unexpected error calling Ollama API: {e}", exc_info=True)
-        return {"json_output": [], "csv_output": ""}
+        return {"json_output": []}
 
 
 def validate_ollama_connection() -> bool:
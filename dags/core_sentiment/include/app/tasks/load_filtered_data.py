@@ -1,13 +1,26 @@
 import logging
-from io import StringIO
+from pathlib import Path
 
+import orjson
 import pandas as pd
-import psycopg
-from core_sentiment.include.app_config.settings import config
+from core_sentiment.include.app_config.db import get_pool
 from pendulum import now
 
 logger = logging.getLogger(__name__)
 
+# Postgres types for binary COPY, keyed by filtered_pageviews column name
+_FILTER_METHOD = "llm_ollama_llama3.2:1b"
+
+_COLUMN_PG_TYPES = {
+    "domain": "text",
+    "page_title": "text",
+    "count_views": "int4",
+    "company": "text",
+    "filtered_at": "timestamp",
+    "processing_date": "date",
+    "filter_method": "text",
+}
+
 
 def load_filtered_pageviews_to_db(filtered_result: dict) -> dict:
     """
@@ -16,8 +29,8 @@ def load_filtered_pageviews_to_db(filtered_result: dict) -> dict:
 
     Args:
         filtered_result (dict):
-            Dictionary that must contain key "csv_output" holding CSV text
-            produced by the LLM.
+            Dictionary that must contain key "filtered_file" holding the
+            path to the JSON file of records produced by the LLM.
 
     Returns:
         dict:
@@ -31,59 +44,86 @@ def load_filtered_pageviews_to_db(filtered_result: dict) -> dict:
         logger.info("Loading filtered data to database...")
 
         # ------------------------------------------------------------------
-        # Parse LLM CSV
+        # Build DataFrame from the LLM records file (XCom carries the path)
         # ------------------------------------------------------------------
-        csv_output = filtered_result.get("csv_output", "")
-        if not csv_output:
+        filtered_file = filtered_result.get("filtered_file", "")
+        if not filtered_file:
+            logger.warning("No filtered data to load")
+            return {"rows_loaded": 0, "status": "empty"}
+
+        records = orjson.loads(Path(filtered_file).read_bytes())
+        if not records:
             logger.warning("No filtered data to load")
             return {"rows_loaded": 0, "status": "empty"}
 
-        df = pd.read_csv(StringIO(csv_output))
+        df = pd.DataFrame(records)
         logger.info(f"Filtered records: {len(df):,}")
 
         # ------------------------------------------------------------------
         # Add metadata columns
         # ------------------------------------------------------------------
         ts = now()
-        df["filtered_at"] = ts
+        # filtered_at is TIMESTAMP (no tz); the binary dumper rejects an
+        # aware value, so strip the offset before COPY
+        df["filtered_at"] = ts.naive()
         df["processing_date"] = ts.date()
-        df["filter_method"] = "llm_ollama_llama3.2:1b"
+        df["filter_method"] = _FILTER_METHOD
 
-        # Postgres COPY needs no index
-        df = df.reset_index(drop=True)
-
-        # ------------------------------------------------------------------
-        # Convert DataFrame → CSV buffer for COPY
         # ------------------------------------------------------------------
-        buffer = StringIO()
-        df.to_csv(buffer, index=False, header=False)  # COPY handles columns
-        buffer.seek(0)
-
+        # Connect with psycopg3 and binary COPY into table
         # ------------------------------------------------------------------
-        # Connect with psycopg3 and COPY into table
-        # ------------------------------------------------------------------
-        conn_string = (
-            f"postgresql://{config.DB_USER}:{config.DB_PASSWORD}"
-            f"@core_sentiment_db:5432/{config.DB_NAME}"
-        )
-
-        with psycopg.connect(conn_string) as conn:
+        with get_pool().connection() as conn:
             with conn.cursor() as cur:
-                # Build COPY command with column list
+                # Retry safety: a repeated run for the same day and filter
+                # method would trip the table's unique constraint mid-COPY
+                # (COPY has no ON CONFLICT), so replace any earlier rows in
+                # the same transaction. The probe keeps clean loads cheap
+                cur.execute(
+                    """
+                    SELECT 1 FROM filtered_pageviews
+                    WHERE processing_date = %s AND filter_method = %s
+                    LIMIT 1
+                    """,
+                    (ts.date(), _FILTER_METHOD),
+                )
+                if cur.fetchone() is not None:
+                    cur.execute(
+                        """
+                        DELETE FROM filtered_pageviews
+                        WHERE processing_date = %s AND filter_method = %s
+                        """,
+                        (ts.date(), _FILTER_METHOD),
+                    )
+                    logger.info(
+                        f"Replacing {cur.rowcount:,} rows from a previous "
+                        f"filtered load for {ts.date()}"
+                    )
+
+                # Build COPY command with column list; binary format skips
+                # the CSV serialize/parse round-trip on both ends
                 columns = ", ".join(df.columns)
                 copy_sql = f"""
                     COPY filtered_pageviews ({columns})
-                    FROM STDIN WITH (FORMAT csv)
+                    FROM STDIN (FORMAT BINARY)
                 """
 
                 logger.info("Executing COPY INTO filtered_pageviews...")
-                cur.copy(copy_sql, buffer)  # type: ignore[arg-type]
+                with cur.copy(copy_sql) as copy:  # type: ignore[arg-type]
+                    copy.set_types(
+                        [_COLUMN_PG_TYPES.get(col, "text") for col in df.columns]
+                    )
+                    for row in df.itertuples(index=False, name=None):
+                        copy.write_row(row)
+
+                # Server-side count of what COPY actually ingested — no
+                # RETURNING round-trip needed to confirm the load
+                rows_loaded = cur.rowcount
                 conn.commit()
 
-        logger.info(f"✓ Loaded {len(df):,} filtered records")
+        logger.info(f"✓ Loaded {rows_loaded:,} filtered records")
 
         return {
-            "rows_loaded": len(df),
+            "rows_loaded": rows_loaded,
             "status": "success",
         }
 
@@ -1,13 +1,54 @@
+import csv
+import io
 import logging
+import os
 
-import pandas as pd
-import psycopg
-from core_sentiment.include.app_config.settings import config
+from core_sentiment.include.app_config.db import get_pool
 from pendulum import now
-from sqlalchemy import create_engine, text
 
 logger = logging.getLogger(__name__)
 
+# Flush COPY data to the server in ~1 MB chunks. Per-line writes pay
+# protocol framing and a socket send per row; megabyte chunks keep the
+# connection saturated instead of yielding after every line.
+_COPY_BUFFER_BYTES = 1 << 20
+
+# Statements used once per load, built once per process. Stable statement
+# text also lets psycopg auto-prepare the parameterized ones on the pooled
+# connection.
+_RAW_COPY_SQL = """
+    COPY raw_pageviews (
+        domain,
+        page_title,
+        count_views,
+        source_file,
+        processing_date
+    ) FROM STDIN WITH (FORMAT CSV)
+"""
+
+_VERIFY_SQL = """
+    SELECT
+        COUNT(*) AS record_count,
+        MIN(loaded_at) AS load_time,
+        COUNT(DISTINCT domain) AS domain_count,
+        SUM(count_views) AS total_views
+    FROM raw_pageviews
+    WHERE source_file = %s
+"""
+
+
+def _fill_missing_fields(line: bytes) -> bytes:
+    """Replace empty domain/page_title fields with 'unknown' in one CSV line.
+
+    Slow path only — called for the rare lines that contain an empty field
+    (the equivalent of the old DataFrame fillna('unknown') pass).
+    """
+    fields = next(csv.reader([line.decode("utf-8")]))
+    fields = [field if field != "" else "unknown" for field in fields]
+    buf = io.StringIO()
+    csv.writer(buf, lineterminator="").writerow(fields)
+    return buf.getvalue().encode("utf-8")
+
 
 def load_raw_pageviews_to_db(extract_info: dict) -> dict:
     """
@@ -46,63 +87,95 @@ def load_raw_pageviews_to_db(extract_info: dict) -> dict:
 
         logger.info(f"Loading raw data from: {csv_path}")
 
-        # Count total rows
-        total_rows = sum(1 for _ in open(csv_path)) - 1
+        # The extract task already counted the rows it wrote — no need to
+        # re-read a multi-GB file just to log a total
+        total_rows = extract_info.get("record_count", 0)
         logger.info(f"Total records to load: {total_rows:,}")
 
-        # Database connection string
-        conn_string = (
-            f"postgresql://{config.DB_USER}:{config.DB_PASSWORD}"
-            f"@core_sentiment_db:5432/{config.DB_NAME}"
-        )
-
         current_time = now()
-        chunk_size = 100_000
-        chunks_processed = 0
 
-        # Connect using psycopg3
-        with psycopg.connect(conn_string) as conn:
+        # Metadata columns are constant for the whole load, so they can be
+        # appended to each CSV line as a precomputed suffix. loaded_at is
+        # not sent at all — the column DEFAULT fills it server-side
+        meta_suffix = f",{source_file},{current_time.date()}\n".encode("utf-8")
+
+        rows_loaded = 0
+
+        # Borrow a pooled connection instead of opening a fresh one per run
+        with get_pool().connection() as conn:
             with conn.cursor() as cur:
-                # Process CSV in chunks
-                for chunk in pd.read_csv(csv_path, chunksize=chunk_size):
-                    # Replace NaN with 'unknown'
-                    chunk["domain"] = chunk["domain"].fillna("unknown")
-                    chunk["page_title"] = chunk["page_title"].fillna("unknown")
-
-                    # Add metadata
-                    chunk["source_file"] = source_file
-                    chunk["loaded_at"] = current_time
-                    chunk["processing_date"] = current_time.date()
-
-                    # Convert to CSV string for COPY
-                    csv_buffer = chunk.to_csv(index=False, header=False)
-
-                    # COPY directly from string
-                    with cur.copy("""
-                        COPY raw_pageviews (
-                            domain,
-                            page_title,
-                            count_views,
-                            source_file,
-                            loaded_at,
-                            processing_date
-                        ) FROM STDIN WITH (FORMAT CSV)
-                    """) as copy:
-                        copy.write(csv_buffer)
-
-                    chunks_processed += 1
-                    rows_loaded = min(chunks_processed * chunk_size, total_rows)
+                # The load can be replayed from the extract CSV on crash, so
+                # skipping the WAL fsync wait for this transaction is safe
+                # and removes the dominant latency of bulk ingestion
+                cur.execute("SET LOCAL synchronous_commit = off")
+
+                # Idempotent reload: clear any rows from a previous attempt
+                # for this source file inside the same transaction as the
+                # COPY, so a retried task replaces instead of duplicating.
+                # A cheap existence probe first — on the common clean load
+                # there is nothing to delete, so the DELETE scan is skipped
+                cur.execute(
+                    "SELECT 1 FROM raw_pageviews WHERE source_file = %s LIMIT 1",
+                    (source_file,),
+                )
+                if cur.fetchone() is not None:
+                    cur.execute(
+                        "DELETE FROM raw_pageviews WHERE source_file = %s",
+                        (source_file,),
+                    )
                     logger.info(
-                        f"Progress: {rows_loaded:,}/{total_rows:,} rows ({rows_loaded/total_rows*100:.1f}%)"
+                        f"Replacing {cur.rowcount:,} rows from a previous "
+                        f"load of {source_file}"
                     )
 
+                # Stream the extract CSV straight into COPY — the file was
+                # just written by the extract task, so there is no need to
+                # re-parse it into DataFrames and serialize it back to CSV.
+                # Binary mode keeps bytes flowing page-cache → socket with
+                # no UTF-8 decode/encode round-trip over the whole file
+                with open(csv_path, "rb") as f:
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                    f.readline()  # Skip header; COPY gets the column list
+
+                    with cur.copy(_RAW_COPY_SQL) as copy:
+                        buffer: list = []
+                        buffered_bytes = 0
+
+                        for line in f:
+                            line = line.rstrip(b"\n")
+                            if not line:
+                                continue
+
+                            # Rare slow path: fill empty fields the way the
+                            # old fillna('unknown') did
+                            if line.startswith(b",") or b",," in line:
+                                line = _fill_missing_fields(line)
+
+                            buffer.append(line + meta_suffix)
+                            buffered_bytes += len(buffer[-1])
+                            rows_loaded += 1
+
+                            if buffered_bytes >= _COPY_BUFFER_BYTES:
+                                copy.write(b"".join(buffer))
+                                buffer.clear()
+                                buffered_bytes = 0
+
+                            if rows_loaded % 500_000 == 0 and total_rows:
+                                logger.info(
+                                    f"Progress: {rows_loaded:,}/{total_rows:,} rows "
+                                    f"({rows_loaded/total_rows*100:.1f}%)"
+                                )
+
+                        if buffer:
+                            copy.write(b"".join(buffer))
+
             # Commit transaction
             conn.commit()
 
-        logger.info(f"✓ Successfully loaded {total_rows:,} records")
+        logger.info(f"✓ Successfully loaded {rows_loaded:,} records")
 
         return {
-            "rows_loaded": total_rows,
+            "rows_loaded": rows_loaded,
             "source_file": source_file,
             "status": "success",
         }
@@ -124,31 +197,21 @@ def verify_load(source_file: str) -> dict:
         Dictionary with verification results
     """
     try:
-        conn_string = (
-            f"postgresql+psycopg2://{config.DB_USER}:{config.DB_PASSWORD}"
-            f"@core_sentiment_db:5432/{config.DB_NAME}"
-        )
-        engine = create_engine(conn_string)
-
-        query = text("""
-            SELECT 
-                COUNT(*) AS record_count,
-                MIN(loaded_at) AS load_time,
-                COUNT(DISTINCT domain) AS domain_count,
-                SUM(count_views) AS total_views
-            FROM raw_pageviews
-            WHERE source_file = :source_file
-        """)
-
-        with engine.connect() as conn:  # ✔ context manager OK
-            result = conn.execute(query, {"source_file": source_file}).one()
+        # Plain psycopg fetch — the query returns 4 scalars, so no need to
+        # pull SQLAlchemy (or a DataFrame) into the picture
+        with get_pool().connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(_VERIFY_SQL, (source_file,))
+                row = cur.fetchone()
+
+        record_count, load_time, domain_count, total_views = row or (0, None, 0, 0)
 
         verification = {
             "source_file": source_file,
-            "record_count": int(result.record_count or 0),
-            "load_time": str(result.load_time) if result.load_time else None,
-            "domain_count": int(result.domain_count or 0),
-            "total_views": int(result.total_views or 0),
+            "record_count": int(record_count or 0),
+            "load_time": str(load_time) if load_time else None,
+            "domain_count": int(domain_count or 0),
+            "total_views": int(total_views or 0),
             "verified": True,
         }
 
@@ -0,0 +1,29 @@
+import threading
+
+from core_sentiment.include.app_config.settings import config
+from psycopg_pool import ConnectionPool
+
+_pool: ConnectionPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ConnectionPool:
+    """Return the per-process warehouse connection pool, creating it lazily.
+
+    Every DB task previously opened (and tore down) its own connection, so
+    each Airflow run paid a fresh TCP + auth handshake per task. A shared
+    pool scoped to the worker process amortizes that across tasks and lets
+    the server reuse session state between calls.
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(
+                    conninfo=config.DB_URL,
+                    min_size=1,
+                    max_size=4,
+                    open=True,
+                    kwargs={"application_name": "core_sentiment"},
+                )
+    return _pool
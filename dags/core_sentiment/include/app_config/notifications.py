@@ -1,11 +1,109 @@
+import atexit
 import logging
+import smtplib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from email.mime.text import MIMEText
 
 import requests
 from airflow.utils.email import send_email
 from core_sentiment.include.app_config.settings import config
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+# Shared session so the TCP+TLS handshake to Slack is paid once per worker,
+# not once per notification. Retries cover transient 5xx from the webhook.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=2,
+        pool_maxsize=4,
+        max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504]),
+    ),
+)
+
+# Slack posts are fire-and-forget: submit them to a small daemon pool so the
+# task callback returns immediately instead of blocking on the webhook for up
+# to 10s. Pending notifications are flushed at interpreter shutdown.
+_notify_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="notify")
+atexit.register(_notify_pool.shutdown, wait=True)
+
+
+class _SMTPHolder:
+    """Keep one SMTP connection alive across notifications.
+
+    Opening a fresh connection costs 3-5 network roundtrips per message
+    (connect, STARTTLS, login). The holder connects lazily, validates the
+    connection with NOOP before each send, and reconnects if the server
+    dropped it. Guarded by a lock since notifications may run on the pool.
+    """
+
+    def __init__(self):
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        conn = smtplib.SMTP(config.SMTP_HOST, config.SMTP_PORT, timeout=30)
+        conn.starttls()
+        if config.SMTP_USER:
+            conn.login(config.SMTP_USER, config.SMTP_PASSWORD)
+        return conn
+
+    def send(self, msg: MIMEText, to_addrs: list) -> None:
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.noop()
+                except (smtplib.SMTPServerDisconnected, smtplib.SMTPException, OSError):
+                    self._conn = None
+            if self._conn is None:
+                self._conn = self._connect()
+            try:
+                self._conn.send_message(msg, to_addrs=to_addrs)
+            except smtplib.SMTPServerDisconnected:
+                # Server closed between NOOP and send; reconnect once
+                self._conn = self._connect()
+                self._conn.send_message(msg, to_addrs=to_addrs)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.quit()
+                except Exception:
+                    pass
+                self._conn = None
+
+
+_smtp = _SMTPHolder()
+atexit.register(_smtp.close)
+
+
+def _send_email(subject: str, body: str) -> None:
+    """Send via the persistent SMTP connection when configured,
+    falling back to Airflow's send_email otherwise."""
+    if config.SMTP_HOST:
+        msg = MIMEText(body)
+        msg["Subject"] = subject
+        msg["From"] = config.EMAIL_FROM or config.SMTP_USER
+        msg["To"] = ", ".join(config.email_to_list)
+        _smtp.send(msg, to_addrs=config.email_to_list)
+    else:
+        send_email(to=config.email_to_list, subject=subject, html_content=body)
+
+
+def _post_slack(message: dict, kind: str) -> None:
+    """Send a Slack webhook message (runs on the notification pool)."""
+    try:
+        response = _SESSION.post(config.SLACK_WEBHOOK_URL, json=message, timeout=10)
+        response.raise_for_status()
+        logger.info(f"Slack {kind} notification sent")
+    except requests.RequestException as e:
+        logger.error(f"Failed to send Slack notification: {e}")
+
 
 def success_email(context):
     """Send success email notification."""
@@ -20,8 +118,7 @@ def success_email(context):
         f'Execution Date: {context["execution_date"]}\n'
         f'Log URL: {task_instance.log_url}\n'
     )
-    # Use email_to_list for multiple recipients
-    send_email(to=config.email_to_list, subject=subject, html_content=body)
+    _send_email(subject, body)
 
 
 def failure_email(context):
@@ -38,8 +135,7 @@ def failure_email(context):
         f'Log URL: {task_instance.log_url}\n'
         f'Error: {context.get("exception")}\n'
     )
-    # Use email_to_list for multiple recipients
-    send_email(to=config.email_to_list, subject=subject, html_content=body)
+    _send_email(subject, body)
 
 
 def success_slack(context):
@@ -69,12 +165,8 @@ def success_slack(context):
             )
         }
 
-        response = requests.post(config.SLACK_WEBHOOK_URL, json=message, timeout=10)
-        response.raise_for_status()
-        logger.info("Slack success notification sent")
+        _notify_pool.submit(_post_slack, message, "success")
 
-    except requests.RequestException as e:
-        logger.error(f"Failed to send Slack notification: {e}")
     except Exception as e:
         logger.error(f"Unexpected error in Slack notification: {e}")
 
@@ -98,9 +190,7 @@ def failure_slack(context):
             )
         }
 
-        response = requests.post(config.SLACK_WEBHOOK_URL, json=message, timeout=10)
-        response.raise_for_status()
-        logger.info("Slack failure notification sent")
+        _notify_pool.submit(_post_slack, message, "failure")
 
     except Exception as e:
         logger.error(f"Failed to send Slack notification: {e}")
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import List
 
 from dotenv import load_dotenv
@@ -14,6 +15,8 @@ class Settings(BaseSettings):
     DB_NAME: str
     DB_USER: str
     DB_PASSWORD: str
+    DB_HOST: str = "core_sentiment_db"
+    DB_PORT: int = 5432
 
     # Ollama configuration with defaults
     OLLAMA_HOST: str
@@ -33,9 +36,17 @@ class Settings(BaseSettings):
     ENABLE_SLACK: bool = False
     SLACK_WEBHOOK_URL: str = ""
 
-    @property
+    @cached_property
+    def DB_URL(self) -> str:
+        """Connection string for the warehouse, built once per process."""
+        return (
+            f"postgresql://{self.DB_USER}:{self.DB_PASSWORD}"
+            f"@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
+        )
+
+    @cached_property
     def email_to_list(self) -> List[str]:
-        """Split comma-separated emails into list."""
+        """Split comma-separated emails into list (parsed once per process)."""
         return [e.strip() for e in self.EMAIL_TO.split(",") if e.strip()]
 
     # Configuration for how environment variables are loaded and handled
@@ -23,12 +23,23 @@ CREATE INDEX IF NOT EXISTS idx_raw_processing_date
 CREATE INDEX IF NOT EXISTS idx_raw_domain 
     ON raw_pageviews(domain);
 
-CREATE INDEX IF NOT EXISTS idx_raw_views 
+CREATE INDEX IF NOT EXISTS idx_raw_views
     ON raw_pageviews(count_views DESC);
 
-CREATE INDEX IF NOT EXISTS idx_raw_page_title_pattern 
+-- Composite index matching the prefilter's stageA predicate
+-- (processing_date = CURRENT_DATE AND count_views >= threshold),
+-- so the daily prefilter runs as one index range scan
+CREATE INDEX IF NOT EXISTS idx_raw_date_views
+    ON raw_pageviews(processing_date, count_views DESC);
+
+CREATE INDEX IF NOT EXISTS idx_raw_page_title_pattern
     ON raw_pageviews USING gin(page_title gin_trgm_ops);
 
+-- Supports the loader's idempotency probe/DELETE and verify_load,
+-- which all filter on source_file
+CREATE INDEX IF NOT EXISTS idx_raw_source_file
+    ON raw_pageviews(source_file);
+
 COMMENT ON TABLE raw_pageviews IS 
     'Warehouse table for all Wikipedia pageviews. 
     Retention policy: 90 days recommended.';
@@ -120,8 +120,17 @@ def pageviews():
 
         @task
         def extract_all_data(zipped_file: str):
-            """Extract all pageview data from archive"""
-            return extract_data(zipped_file)
+            """Extract all pageview data from archive.
+
+            Runs in a single-worker subprocess so the extraction heap
+            (Arrow buffers, decompression state) is returned to the OS
+            when the child exits, instead of lingering as fragmentation
+            in the long-lived Airflow worker.
+            """
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                return executor.submit(extract_data, zipped_file).result()
 
         @task
         def load_raw_to_warehouse(extract_info: dict):
@@ -155,7 +164,7 @@ def pageviews():
             return prefilter_from_db()
 
         @task
-        def llm_filter_products(csv_file: str):
+        def llm_filter_products(prefiltered_file: str):
             """
             LLM-powered filtering to identify genuine product/service pages.
 
@@ -166,7 +175,7 @@ def pageviews():
                 - Removes people, places, events, legal cases
             """
             return process_with_llm(
-                prefiltered_csv_file=csv_file,
+                prefiltered_file=prefiltered_file,
                 system_prompt=SYSTEM_PROMPT,
                 batch_size=50,
             )
@@ -216,17 +225,15 @@ def pageviews():
     with TaskGroup("finalize", tooltip="Cleanup and notifications") as finalize:
 
         @task
-        def cleanup_temp(csv_path: str):
+        def cleanup_temp(temp_path: str):
             """Remove temporary files after successful processing."""
-            return cleanup_temp_files(csv_path)
+            return cleanup_temp_files(temp_path)
 
         @task(on_success_callback=success_slack)
         def notify_success(**context):
             """Send success notifications."""
             success_email(context)
 
-        notify_task = notify_success()
-
         cleanup_task = cleanup_temp(prefilter_task)  # type: ignore[arg-type]
         notify_task = notify_success()
 